@@ -1,5 +1,6 @@
-import struct
-from typing import Optional, Tuple
+import functools
+import warnings
+from typing import Callable, Optional, Tuple
 from typing_extensions import Literal, assert_never
 
 import torch
@@ -7,24 +8,87 @@ import torch.nn.functional as F
 from torch import Tensor
 
 
+def _maybe_compile(fn: Callable, **compile_kwargs) -> Callable:
+    """`torch.compile(fn, **compile_kwargs)` that falls back to the eager `fn`.
+
+    The eager function is used where dynamo is unsupported, and for good once the
+    first compiled call fails. Inductor only compiles on that first call, so this
+    covers e.g. GPUs too old for Triton (below sm_70) or CPUs without a C++
+    toolchain.
+    """
+    try:
+        from torch._dynamo import is_dynamo_supported
+    except ImportError:
+        return fn
+    if not is_dynamo_supported():
+        return fn
+    compiled = torch.compile(fn, **compile_kwargs)
+    verified = False
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        nonlocal compiled, verified
+        if compiled is None:
+            return fn(*args, **kwargs)
+        if verified:
+            return compiled(*args, **kwargs)
+        try:
+            outputs = compiled(*args, **kwargs)
+        except Exception as e:
+            warnings.warn(
+                f"torch.compile failed for {fn.__name__}(), falling back to eager "
+                f"mode: {type(e).__name__}: {e}"
+            )
+            compiled = None
+            return fn(*args, **kwargs)
+        verified = True
+        return outputs
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=None)
+def _quat_to_rotmat_coeffs(
+    device: torch.device, dtype: torch.dtype
+) -> Tuple[Tensor, Tensor]:
+    """Linear map from the quaternion outer product (w, x, y, z) to a rotation matrix.
+
+    Returns:
+        A tuple:
+
+        - **coeffs**: Coefficients applied to the flattened outer product. [16, 9].
+        - **bias**: Constant term of the flattened rotation matrix. [9].
+    """
+    w, x, y, z = range(4)
+    terms = [
+        [(y, y, -2.0), (z, z, -2.0)],
+        [(x, y, 2.0), (w, z, -2.0)],
+        [(x, z, 2.0), (w, y, 2.0)],
+        [(x, y, 2.0), (w, z, 2.0)],
+        [(x, x, -2.0), (z, z, -2.0)],
+        [(y, z, 2.0), (w, x, -2.0)],
+        [(x, z, 2.0), (w, y, -2.0)],
+        [(y, z, 2.0), (w, x, 2.0)],
+        [(x, x, -2.0), (y, y, -2.0)],
+    ]
+    # The result is cached, so it must not become an inference tensor even if the
+    # first call happens under `torch.inference_mode()`.
+    with torch.inference_mode(False):
+        coeffs = torch.zeros((4, 4, 9), dtype=dtype)
+        for k, entries in enumerate(terms):
+            for i, j, v in entries:
+                coeffs[i, j, k] = v
+        bias = torch.tensor([1, 0, 0, 0, 1, 0, 0, 0, 1], dtype=dtype)
+        return coeffs.reshape(16, 9).to(device), bias.to(device)
+
+
 def _quat_to_rotmat(quats: Tensor) -> Tensor:
     """Convert quaternion to rotation matrix."""
-    quats = F.normalize(quats, p=2, dim=-1)
-    w, x, y, z = torch.unbind(quats, dim=-1)
-    R = torch.stack(
-        [
-            1 - 2 * (y**2 + z**2),
-            2 * (x * y - w * z),
-            2 * (x * z + w * y),
-            2 * (x * y + w * z),
-            1 - 2 * (x**2 + z**2),
-            2 * (y * z - w * x),
-            2 * (x * z - w * y),
-            2 * (y * z + w * x),
-            1 - 2 * (x**2 + y**2),
-        ],
-        dim=-1,
-    )
+    inv_norm = torch.rsqrt(quats.pow(2).sum(dim=-1, keepdim=True).clamp_min(1e-20))
+    quats = quats * inv_norm  # (..., 4)
+    coeffs, bias = _quat_to_rotmat_coeffs(quats.device, quats.dtype)
+    qq = quats[..., :, None] * quats[..., None, :]  # (..., 4, 4)
+    R = torch.matmul(qq.reshape(qq.shape[:-2] + (16,)), coeffs) + bias  # (..., 9)
     return R.reshape(quats.shape[:-1] + (3, 3))
 
 
@@ -38,6 +102,18 @@ def _quat_scale_to_matrix(
     return M
 
 
+def _triu_3x3(mats: Tensor) -> Tensor:
+    """Upper triangle of symmetric 3x3 matrices, row-major. (..., 3, 3) -> (..., 6)."""
+    return torch.cat([mats[..., 0, :], mats[..., 1, 1:], mats[..., 2, 2:]], dim=-1)
+
+
+def _triu_to_3x3(triu: Tensor) -> Tensor:
+    """Inverse of `_triu_3x3()`. (..., 6) -> (..., 3, 3)."""
+    xx, xy, xz, yy, yz, zz = torch.unbind(triu, dim=-1)
+    mats = torch.stack([xx, xy, xz, xy, yy, yz, xz, yz, zz], dim=-1)
+    return mats.reshape(triu.shape[:-1] + (3, 3))
+
+
 def _quat_scale_to_covar_preci(
     quats: Tensor,  # [N, 4],
     scales: Tensor,  # [N, 3],
@@ -52,18 +128,12 @@ def _quat_scale_to_covar_preci(
         M = R * scales[..., None, :]  # (..., 3, 3)
         covars = torch.bmm(M, M.transpose(-1, -2))  # (..., 3, 3)
         if triu:
-            covars = covars.reshape(covars.shape[:-2] + (9,))  # (..., 9)
-            covars = (
-                covars[..., [0, 1, 2, 4, 5, 8]] + covars[..., [0, 3, 6, 4, 7, 8]]
-            ) / 2.0  # (..., 6)
+            covars = _triu_3x3(covars)  # (..., 6)
     if compute_preci:
         P = R * (1 / scales[..., None, :])  # (..., 3, 3)
         precis = torch.bmm(P, P.transpose(-1, -2))  # (..., 3, 3)
         if triu:
-            precis = precis.reshape(precis.shape[:-2] + (9,))
-            precis = (
-                precis[..., [0, 1, 2, 4, 5, 8]] + precis[..., [0, 3, 6, 4, 7, 8]]
-            ) / 2.0
+            precis = _triu_3x3(precis)  # (..., 6)
 
     return covars if compute_covar else None, precis if compute_preci else None
 
@@ -109,14 +179,17 @@ def _persp_proj(
     tx = tz * torch.clamp(tx / tz, min=-lim_x_neg, max=lim_x_pos)
     ty = tz * torch.clamp(ty / tz, min=-lim_y_neg, max=lim_y_pos)
 
-    O = torch.zeros((C, N), device=means.device, dtype=means.dtype)
-    J = torch.stack(
-        [fx / tz, O, -fx * tx / tz2, O, fy / tz, -fy * ty / tz2], dim=-1
-    ).reshape(C, N, 2, 3)
+    O = tz.new_zeros(()).expand(C, N)  # stride-0 view, no [C, N] allocation
+    J = (
+        torch.stack([fx / tz, O, -fx * tx / tz2, O, fy / tz, -fy * ty / tz2], dim=-1)
+        .reshape(C, N, 2, 3)
+        .to(covars.dtype)
+    )
 
-    cov2d = torch.einsum("...ij,...jk,...kl->...il", J, covars, J.transpose(-1, -2))
-    means2d = torch.einsum("cij,cnj->cni", Ks[:, :2, :3], means)  # [C, N, 2]
-    means2d = means2d / tz[..., None]  # [C, N, 2]
+    cov2d = torch.matmul(torch.matmul(J, covars), J.mT)  # [C, N, 2, 2]
+    fxfy = Ks.diagonal(dim1=-2, dim2=-1)[:, None, :2]  # [C, 1, 2]
+    cxcy = Ks[:, None, :2, 2]  # [C, 1, 2]
+    means2d = means[..., :2] / tz[..., None] * fxfy + cxcy  # [C, N, 2]
     return means2d, cov2d  # [C, N, 2], [C, N, 2, 2]
 
 
@@ -169,19 +242,23 @@ def _fisheye_proj(
     x2y2z2_inv = 1.0 / (x2y2 + z * z)
     b = torch.atan2(xy_len, z) / xy_len / x2y2
     a = z * x2y2z2_inv / (x2y2)
-    J = torch.stack(
-        [
-            fx * (x2 * a + y2 * b),
-            fx * xy * (a - b),
-            -fx * x * x2y2z2_inv,
-            fy * xy * (a - b),
-            fy * (y2 * a + x2 * b),
-            -fy * y * x2y2z2_inv,
-        ],
-        dim=-1,
-    ).reshape(C, N, 2, 3)
+    J = (
+        torch.stack(
+            [
+                fx * (x2 * a + y2 * b),
+                fx * xy * (a - b),
+                -fx * x * x2y2z2_inv,
+                fy * xy * (a - b),
+                fy * (y2 * a + x2 * b),
+                -fy * y * x2y2z2_inv,
+            ],
+            dim=-1,
+        )
+        .reshape(C, N, 2, 3)
+        .to(covars.dtype)
+    )
 
-    cov2d = torch.einsum("...ij,...jk,...kl->...il", J, covars, J.transpose(-1, -2))
+    cov2d = torch.matmul(torch.matmul(J, covars), J.mT)  # [C, N, 2, 2]
     return means2d, cov2d  # [C, N, 2], [C, N, 2, 2]
 
 
@@ -212,16 +289,29 @@ def _ortho_proj(
     fx = Ks[..., 0, 0, None]  # [C, 1]
     fy = Ks[..., 1, 1, None]  # [C, 1]
 
-    O = torch.zeros((C, 1), device=means.device, dtype=means.dtype)
-    J = torch.stack([fx, O, O, O, fy, O], dim=-1).reshape(C, 1, 2, 3).repeat(1, N, 1, 1)
+    O = fx.new_zeros(()).expand(C, 1)  # stride-0 view
+    J = torch.stack([fx, O, O, O, fy, O], dim=-1).reshape(C, 1, 2, 3)
+    J = J.to(covars.dtype)
 
-    cov2d = torch.einsum("...ij,...jk,...kl->...il", J, covars, J.transpose(-1, -2))
-    means2d = (
-        means[..., :2] * Ks[:, None, [0, 1], [0, 1]] + Ks[:, None, [0, 1], [2, 2]]
-    )  # [C, N, 2]
+    cov2d = torch.matmul(torch.matmul(J, covars), J.mT)  # [C, N, 2, 2]
+    fxfy = Ks.diagonal(dim1=-2, dim2=-1)[:, None, :2]  # [C, 1, 2]
+    cxcy = Ks[:, None, :2, 2]  # [C, 1, 2]
+    means2d = means[..., :2] * fxfy + cxcy  # [C, N, 2]
     return means2d, cov2d  # [C, N, 2], [C, N, 2, 2]
 
 
+def _world_to_cam_single(
+    R: Tensor,  # [3, 3]
+    t: Tensor,  # [3]
+    means: Tensor,  # [N, 3]
+    covars: Tensor,  # [N, 3, 3]
+) -> Tuple[Tensor, Tensor]:
+    """World to camera transformation of Gaussians for a single camera."""
+    means_c = torch.matmul(means, R.mT) + t  # [N, 3]
+    covars_c = torch.matmul(torch.matmul(R, covars), R.mT)  # [N, 3, 3]
+    return means_c, covars_c
+
+
 def _world_to_cam(
     means: Tensor,  # [N, 3]
     covars: Tensor,  # [N, 3, 3]
@@ -242,14 +332,14 @@ def _world_to_cam(
     """
     R = viewmats[:, :3, :3]  # [C, 3, 3]
     t = viewmats[:, :3, 3]  # [C, 3]
-    means_c = torch.einsum("cij,nj->cni", R, means) + t[:, None, :]  # (C, N, 3)
-    covars_c = torch.einsum("cij,njk,clk->cnil", R, covars, R)  # [C, N, 3, 3]
-    return means_c, covars_c
+    return torch.vmap(_world_to_cam_single, in_dims=(0, 0, None, None))(
+        R, t, means, covars
+    )  # [C, N, 3], [C, N, 3, 3]
 
 
 def _fully_fused_projection(
     means: Tensor,  # [N, 3]
-    covars: Tensor,  # [N, 3, 3]
+    covars: Tensor,  # [N, 3, 3] or [N, 6]
     viewmats: Tensor,  # [C, 4, 4]
     Ks: Tensor,  # [C, 3, 3]
     width: int,
@@ -259,6 +349,7 @@ def _fully_fused_projection(
     far_plane: float = 1e10,
     calc_compensations: bool = False,
     camera_model: Literal["pinhole", "ortho", "fisheye"] = "pinhole",
+    proj_dtype: Optional[torch.dtype] = None,
 ) -> Tuple[Tensor, Tensor, Tensor, Tensor, Optional[Tensor]]:
     """PyTorch implementation of `gsplat.cuda._wrapper.fully_fused_projection()`
 
@@ -266,8 +357,23 @@ def _fully_fused_projection(
 
         This is a minimal implementation of fully fused version, which has more
         arguments. Not all arguments are supported.
+
+    `covars` can be either full matrices [N, 3, 3] or, as in the CUDA version, the
+    flattened upper triangle [N, 6].
+
+    `proj_dtype` optionally runs the covariance projection (J @ covars @ J^T) in a
+    lower precision such as `torch.bfloat16`. Means, depths, and the determinant
+    and inverse of the 2D covariances stay in the input precision.
+
+    Gaussians outside the near/far planes or the image, or with a degenerate 2D
+    covariance, are culled by zeroing only their `radii`. Their `means2d`, `conics`
+    and `compensations` are still computed and should be ignored.
     """
+    if covars.shape[-1] == 6:
+        covars = _triu_to_3x3(covars)  # [N, 3, 3]
     means_c, covars_c = _world_to_cam(means, covars, viewmats)
+    if proj_dtype is not None:
+        covars_c = covars_c.to(proj_dtype)
 
     if camera_model == "ortho":
         means2d, covars2d = _ortho_proj(means_c, covars_c, Ks, width, height)
@@ -277,17 +383,16 @@ def _fully_fused_projection(
         means2d, covars2d = _persp_proj(means_c, covars_c, Ks, width, height)
     else:
         assert_never(camera_model)
+    covars2d = covars2d.to(means2d.dtype)
 
-    det_orig = (
-        covars2d[..., 0, 0] * covars2d[..., 1, 1]
-        - covars2d[..., 0, 1] * covars2d[..., 1, 0]
-    )
-    covars2d = covars2d + torch.eye(2, device=means.device, dtype=means.dtype) * eps2d
+    cov_xx, cov_xy, cov_yx, cov_yy = torch.unbind(covars2d.flatten(-2), dim=-1)
+    if calc_compensations:
+        det_orig = cov_xx * cov_yy - cov_xy * cov_yx
+    # Blur only touches the diagonal, so add eps2d there directly.
+    cov_xx = cov_xx + eps2d
+    cov_yy = cov_yy + eps2d
 
-    det = (
-        covars2d[..., 0, 0] * covars2d[..., 1, 1]
-        - covars2d[..., 0, 1] * covars2d[..., 1, 0]
-    )
+    det = cov_xx * cov_yy - cov_xy * cov_yx
     det = det.clamp(min=1e-10)
 
     if calc_compensations:
@@ -295,38 +400,45 @@ def _fully_fused_projection(
     else:
         compensations = None
 
-    conics = torch.stack(
-        [
-            covars2d[..., 1, 1] / det,
-            -(covars2d[..., 0, 1] + covars2d[..., 1, 0]) / 2.0 / det,
-            covars2d[..., 0, 0] / det,
-        ],
-        dim=-1,
+    inv_det = 1.0 / det  # [C, N]
+    conics = (
+        torch.stack([cov_yy, -0.5 * (cov_xy + cov_yx), cov_xx], dim=-1)
+        * inv_det[..., None]
     )  # [C, N, 3]
 
     depths = means_c[..., 2]  # [C, N]
 
-    b = (covars2d[..., 0, 0] + covars2d[..., 1, 1]) / 2  # (...,)
+    b = (cov_xx + cov_yy) / 2  # (...,)
     v1 = b + torch.sqrt(torch.clamp(b**2 - det, min=0.01))  # (...,)
     radius = torch.ceil(3.0 * torch.sqrt(v1))  # (...,)
     # v2 = b - torch.sqrt(torch.clamp(b**2 - det, min=0.01))  # (...,)
     # radius = torch.ceil(3.0 * torch.sqrt(torch.max(v1, v2)))  # (...,)
 
     valid = (det > 0) & (depths > near_plane) & (depths < far_plane)
-    radius[~valid] = 0.0
-
     inside = (
         (means2d[..., 0] + radius > 0)
         & (means2d[..., 0] - radius < width)
         & (means2d[..., 1] + radius > 0)
         & (means2d[..., 1] - radius < height)
     )
-    radius[~inside] = 0.0
+    radius = radius.masked_fill(~(valid & inside), 0.0)
 
     radii = radius.int()
     return radii, means2d, depths, conics, compensations
 
 
+@functools.lru_cache(maxsize=None)
+def _fully_fused_projection_compiled() -> Callable:
+    """`_fully_fused_projection` compiled on first use, see `_maybe_compile`.
+
+    Fuses the many small elementwise ops into a handful of Triton kernels.
+    `dynamic=True` avoids recompiling whenever the number of Gaussians changes.
+    CUDA graphs ("reduce-overhead") are not used as they would re-record for every
+    new count.
+    """
+    return _maybe_compile(_fully_fused_projection, dynamic=True, fullgraph=False)
+
+
 @torch.no_grad()
 def _isect_tiles(
     means2d: Tensor,
@@ -360,40 +472,36 @@ def _isect_tiles(
     tiles_per_gauss *= radii > 0.0
 
     n_isects = tiles_per_gauss.sum().item()
-    isect_ids = torch.empty(n_isects, dtype=torch.int64, device=device)
-    flatten_ids = torch.empty(n_isects, dtype=torch.int32, device=device)
-
-    cum_tiles_per_gauss = torch.cumsum(tiles_per_gauss.flatten(), dim=0)
     tile_n_bits = (tile_width * tile_height).bit_length()
 
-    def binary(num):
-        return "".join("{:0>8b}".format(c) for c in struct.pack("!f", num))
-
-    def kernel(cam_id, gauss_id):
-        if radii[cam_id, gauss_id] <= 0.0:
-            return
-        index = cam_id * N + gauss_id
-        curr_idx = cum_tiles_per_gauss[index - 1] if index > 0 else 0
-
-        depth_id = struct.unpack("i", struct.pack("f", depths[cam_id, gauss_id]))[0]
-
-        tile_min = tile_mins[cam_id, gauss_id]
-        tile_max = tile_maxs[cam_id, gauss_id]
-        for y in range(tile_min[1], tile_max[1]):
-            for x in range(tile_min[0], tile_max[0]):
-                tile_id = y * tile_width + x
-                isect_ids[curr_idx] = (
-                    (cam_id << 32 << tile_n_bits) | (tile_id << 32) | depth_id
-                )
-                flatten_ids[curr_idx] = index  # flattened index
-                curr_idx += 1
-
-    for cam_id in range(C):
-        for gauss_id in range(N):
-            kernel(cam_id, gauss_id)
+    # Expand every Gaussian into one entry per intersected tile, ordered by
+    # camera, Gaussian, tile row and then tile column.
+    tiles_per_gauss_fl = tiles_per_gauss.flatten()  # [C * N]
+    flatten_ids = torch.repeat_interleave(
+        torch.arange(C * N, device=device), tiles_per_gauss_fl, output_size=n_isects
+    )  # [n_isects]
+    cum_tiles_per_gauss = torch.cumsum(tiles_per_gauss_fl, dim=0)
+    local_ids = (
+        torch.arange(n_isects, device=device)
+        - (cum_tiles_per_gauss - tiles_per_gauss_fl)[flatten_ids]
+    )  # [n_isects]
+
+    tile_mins_fl = tile_mins.reshape(C * N, 2)[flatten_ids]  # [n_isects, 2]
+    tile_dx = (tile_maxs[..., 0] - tile_mins[..., 0]).flatten()[flatten_ids]
+    tile_xs = tile_mins_fl[:, 0] + local_ids % tile_dx
+    tile_ys = tile_mins_fl[:, 1] + local_ids // tile_dx
+    tile_ids = (tile_ys * tile_width + tile_xs).long()  # [n_isects]
+    cam_ids = flatten_ids // N  # [n_isects]
+    # Bitcast the float32 depths to int32 (sign-extended, as in the CUDA kernel).
+    depth_ids = depths.float().flatten().view(torch.int32)[flatten_ids].long()
+
+    isect_ids = (cam_ids << (32 + tile_n_bits)) | (tile_ids << 32) | depth_ids
+    flatten_ids = flatten_ids.int()
 
     if sort:
-        isect_ids, sort_indices = torch.sort(isect_ids)
+        # Stable like the CUB radix sort in the CUDA version, so ties keep their
+        # (camera, Gaussian, tile) order.
+        isect_ids, sort_indices = torch.sort(isect_ids, stable=True)
         flatten_ids = flatten_ids[sort_indices]
 
     return tiles_per_gauss.int(), isect_ids, flatten_ids
@@ -411,22 +519,53 @@ def _isect_offset_encode(
         arguments. Not all arguments are supported.
     """
     tile_n_bits = (tile_width * tile_height).bit_length()
-    tile_counts = torch.zeros(
-        (C, tile_height, tile_width), dtype=torch.int64, device=isect_ids.device
-    )
+    n_tiles = tile_width * tile_height
 
-    isect_ids_uq, counts = torch.unique_consecutive(isect_ids >> 32, return_counts=True)
+    isect_keys = isect_ids >> 32
+    cam_ids = isect_keys >> tile_n_bits
+    tile_ids = isect_keys & ((1 << tile_n_bits) - 1)
+    tile_counts = torch.bincount(cam_ids * n_tiles + tile_ids, minlength=C * n_tiles)
 
-    cam_ids_uq = isect_ids_uq >> tile_n_bits
-    tile_ids_uq = isect_ids_uq & ((1 << tile_n_bits) - 1)
-    tile_ids_x_uq = tile_ids_uq % tile_width
-    tile_ids_y_uq = tile_ids_uq // tile_width
+    offsets = torch.cumsum(tile_counts, dim=0) - tile_counts
+    offsets = offsets.reshape(C, tile_height, tile_width)
+    return offsets.int()
 
-    tile_counts[cam_ids_uq, tile_ids_y_uq, tile_ids_x_uq] = counts
 
-    cum_tile_counts = torch.cumsum(tile_counts.flatten(), dim=0).reshape_as(tile_counts)
-    offsets = cum_tile_counts - tile_counts
-    return offsets.int()
+def _accumulate_alphas(
+    pixel_coords: Tensor,  # [M, 2]
+    means2d: Tensor,  # [M, 2]
+    conics: Tensor,  # [M, 3]
+    opacities: Tensor,  # [M]
+    alpha_dtype: Optional[torch.dtype] = None,
+) -> Tensor:
+    """Alphas of the 2D Gaussians at each intersecting pixel. [M]
+
+    If `alpha_dtype` is given, everything after the pixel-to-mean offsets runs in
+    that precision.
+    """
+    deltas = pixel_coords - means2d  # [M, 2]
+    dtype = deltas.dtype
+    if alpha_dtype is not None:
+        deltas = deltas.to(alpha_dtype)
+        conics = conics.to(alpha_dtype)
+        opacities = opacities.to(alpha_dtype)
+    sigmas = (
+        0.5 * (conics[:, 0] * deltas[:, 0] ** 2 + conics[:, 2] * deltas[:, 1] ** 2)
+        + conics[:, 1] * deltas[:, 0] * deltas[:, 1]
+    )  # [M]
+    # Clamp in the original precision: 0.999 rounds to 1.0 in bfloat16.
+    alphas = (opacities * torch.exp(-sigmas)).to(dtype)
+    return torch.clamp_max(alphas, 0.999)
+
+
+@functools.lru_cache(maxsize=None)
+def _accumulate_alphas_compiled() -> Callable[..., Tensor]:
+    """`_accumulate_alphas` compiled on first use, see `_maybe_compile`.
+
+    The conic quadratic form, exp and clamp then run as a single elementwise
+    kernel without materializing the intermediates.
+    """
+    return _maybe_compile(_accumulate_alphas, dynamic=True)
 
 #TODO: function we need to change for negative gaussian splatting
 def accumulate(
@@ -439,6 +578,7 @@ def accumulate(
     camera_ids: Tensor,  # [M]
     image_width: int,
     image_height: int,
+    alpha_dtype: Optional[torch.dtype] = None,
 ) -> Tuple[Tensor, Tensor]:
     """Alpah compositing of 2D Gaussians in Pure Pytorch.
 
@@ -471,6 +611,8 @@ def accumulate(
         camera_ids: Collection of camera indices to be rasterized. A flattened list of shape [M].
         image_width: Image width.
         image_height: Image height.
+        alpha_dtype: Optional lower precision (e.g. `torch.bfloat16`) for evaluating
+            the Gaussian falloff. Default: None (same as the inputs).
 
     Returns:
         A tuple:
@@ -490,15 +632,15 @@ def accumulate(
     pixel_ids_x = pixel_ids % image_width
     pixel_ids_y = pixel_ids // image_width # 8510MiB
     pixel_coords = torch.stack([pixel_ids_x, pixel_ids_y], dim=-1) + 0.5  # [M, 2] 13100MiB
-    deltas = pixel_coords - means2d[camera_ids, gaussian_ids]  # [M, 2] 13100MiB
-    c = conics[camera_ids, gaussian_ids]  # [M, 3]  15394MiB
-    sigmas = (
-        0.5 * (c[:, 0] * deltas[:, 0] ** 2 + c[:, 2] * deltas[:, 1] ** 2)
-        + c[:, 1] * deltas[:, 0] * deltas[:, 1]
-    )  # [M] 18458MiB
-    alphas = torch.clamp_max(
-        opacities[camera_ids, gaussian_ids] * torch.exp(-sigmas), 0.999
-    ) # 19990MiB
+    # Gather per-intersection attributes with one linear index into [C * N].
+    flat_ids = camera_ids * N + gaussian_ids  # [M]
+    alphas = _accumulate_alphas_compiled()(
+        pixel_coords,
+        means2d.reshape(C * N, 2).index_select(0, flat_ids),
+        conics.reshape(C * N, 3).index_select(0, flat_ids),
+        opacities.reshape(C * N).index_select(0, flat_ids),
+        alpha_dtype=alpha_dtype,
+    )  # [M]
 
     indices = camera_ids * image_height * image_width + pixel_ids
     total_pixels = C * image_height * image_width #  23050MiB
@@ -531,6 +673,7 @@ def _rasterize_to_pixels(
     flatten_ids: Tensor,  # [n_isects]
     backgrounds: Optional[Tensor] = None,  # [C, channels]
     batch_per_iter: int = 100,
+    alpha_dtype: Optional[torch.dtype] = None,
 ):
     """Pytorch implementation of `gsplat.cuda._wrapper.rasterize_to_pixels()`.
 
@@ -560,16 +703,21 @@ def _rasterize_to_pixels(
     n_isects = len(flatten_ids)
     device = means2d.device
 
+    # Updated in place below, so allocate them in the input dtypes.
     render_colors = torch.zeros(
-        (C, image_height, image_width, colors.shape[-1]), device=device
+        (C, image_height, image_width, colors.shape[-1]),
+        device=device,
+        dtype=colors.dtype,
+    )
+    render_alphas = torch.zeros(
+        (C, image_height, image_width, 1), device=device, dtype=opacities.dtype
     )
-    render_alphas = torch.zeros((C, image_height, image_width, 1), device=device)
 
     # Split Gaussians into batches and iteratively accumulate the renderings
     block_size = tile_size * tile_size
-    isect_offsets_fl = torch.cat(
-        [isect_offsets.flatten(), torch.tensor([n_isects], device=device)]
-    )
+    isect_offsets_fl = isect_offsets.new_empty(isect_offsets.numel() + 1)
+    isect_offsets_fl[:-1] = isect_offsets.flatten()
+    isect_offsets_fl[-1] = n_isects  # scalar fill, no host-to-device tensor copy
     max_range = (isect_offsets_fl[1:] - isect_offsets_fl[:-1]).max().item()
     num_batches = (max_range + block_size - 1) // block_size
     for step in range(0, num_batches, batch_per_iter):
@@ -604,9 +752,10 @@ def _rasterize_to_pixels(
             camera_ids,
             image_width,
             image_height,
+            alpha_dtype=alpha_dtype,
         ) # 6980MiB 
-        render_colors = render_colors + renders_step * transmittances[..., None]
-        render_alphas = render_alphas + accs_step * transmittances[..., None]
+        render_colors.addcmul_(renders_step, transmittances[..., None])
+        render_alphas.addcmul_(accs_step, transmittances[..., None])
 
     render_alphas = render_alphas
     if backgrounds is not None:
@@ -632,54 +781,54 @@ def _eval_sh_bases_fast(basis_dim: int, dirs: Tensor):
 
     See reference C++ code in https://jcgt.org/published/0002/02/06/code.zip
     """
-    result = torch.empty(
-        (*dirs.shape[:-1], basis_dim), dtype=dirs.dtype, device=dirs.device
-    )
-
-    result[..., 0] = 0.2820947917738781
+    # Bases are collected in index order and stacked once at the end, so the
+    # output is written contiguously instead of one strided column at a time.
+    bases = [torch.full_like(dirs[..., 0], 0.2820947917738781)]
 
     if basis_dim <= 1:
-        return result
+        return torch.stack(bases, dim=-1)
 
     x, y, z = dirs.unbind(-1)
 
     fTmpA = -0.48860251190292
-    result[..., 2] = -fTmpA * z
-    result[..., 3] = fTmpA * x
-    result[..., 1] = fTmpA * y
+    bases += [fTmpA * y, -fTmpA * z, fTmpA * x]
 
     if basis_dim <= 4:
-        return result
+        return torch.stack(bases, dim=-1)
 
     z2 = z * z
     fTmpB = -1.092548430592079 * z
     fTmpA = 0.5462742152960395
     fC1 = x * x - y * y
     fS1 = 2 * x * y
-    result[..., 6] = 0.9461746957575601 * z2 - 0.3153915652525201
-    result[..., 7] = fTmpB * x
-    result[..., 5] = fTmpB * y
-    result[..., 8] = fTmpA * fC1
-    result[..., 4] = fTmpA * fS1
+    bases += [
+        fTmpA * fS1,
+        fTmpB * y,
+        0.9461746957575601 * z2 - 0.3153915652525201,
+        fTmpB * x,
+        fTmpA * fC1,
+    ]
 
     if basis_dim <= 9:
-        return result
+        return torch.stack(bases, dim=-1)
 
     fTmpC = -2.285228997322329 * z2 + 0.4570457994644658
     fTmpB = 1.445305721320277 * z
     fTmpA = -0.5900435899266435
     fC2 = x * fC1 - y * fS1
     fS2 = x * fS1 + y * fC1
-    result[..., 12] = z * (1.865881662950577 * z2 - 1.119528997770346)
-    result[..., 13] = fTmpC * x
-    result[..., 11] = fTmpC * y
-    result[..., 14] = fTmpB * fC1
-    result[..., 10] = fTmpB * fS1
-    result[..., 15] = fTmpA * fC2
-    result[..., 9] = fTmpA * fS2
+    bases += [
+        fTmpA * fS2,
+        fTmpB * fS1,
+        fTmpC * y,
+        z * (1.865881662950577 * z2 - 1.119528997770346),
+        fTmpC * x,
+        fTmpB * fC1,
+        fTmpA * fC2,
+    ]
 
     if basis_dim <= 16:
-        return result
+        return torch.stack(bases, dim=-1)
 
     fTmpD = z * (-4.683325804901025 * z2 + 2.007139630671868)
     fTmpC = 3.31161143515146 * z2 - 0.47308734787878
@@ -687,18 +836,19 @@ def _eval_sh_bases_fast(basis_dim: int, dirs: Tensor):
     fTmpA = 0.6258357354491763
     fC3 = x * fC2 - y * fS2
     fS3 = x * fS2 + y * fC2
-    result[..., 20] = 1.984313483298443 * z2 * (
-        1.865881662950577 * z2 - 1.119528997770346
-    ) + -1.006230589874905 * (0.9461746957575601 * z2 - 0.3153915652525201)
-    result[..., 21] = fTmpD * x
-    result[..., 19] = fTmpD * y
-    result[..., 22] = fTmpC * fC1
-    result[..., 18] = fTmpC * fS1
-    result[..., 23] = fTmpB * fC2
-    result[..., 17] = fTmpB * fS2
-    result[..., 24] = fTmpA * fC3
-    result[..., 16] = fTmpA * fS3
-    return result
+    bases += [
+        fTmpA * fS3,
+        fTmpB * fS2,
+        fTmpC * fS1,
+        fTmpD * y,
+        1.984313483298443 * z2 * (1.865881662950577 * z2 - 1.119528997770346)
+        + -1.006230589874905 * (0.9461746957575601 * z2 - 0.3153915652525201),
+        fTmpD * x,
+        fTmpC * fC1,
+        fTmpB * fC2,
+        fTmpA * fC3,
+    ]
+    return torch.stack(bases, dim=-1)
 
 
 def _spherical_harmonics(
@@ -709,6 +859,7 @@ def _spherical_harmonics(
     """Pytorch implementation of `gsplat.cuda._wrapper.spherical_harmonics()`."""
     dirs = F.normalize(dirs, p=2, dim=-1)
     num_bases = (degree + 1) ** 2
-    bases = torch.zeros_like(coeffs[..., 0])
-    bases[..., :num_bases] = _eval_sh_bases_fast(num_bases, dirs)
-    return (bases[..., None] * coeffs).sum(dim=-2)
+    bases = _eval_sh_bases_fast(num_bases, dirs)  # [..., num_bases]
+    # Batched vector-matrix product over the active bands only.
+    colors = torch.matmul(bases[..., None, :], coeffs[..., :num_bases, :])
+    return colors.squeeze(-2)  # [..., 3]
@@ -1,3 +1,4 @@
+import functools
 from typing import Optional, Tuple
 
 import torch
@@ -6,6 +7,15 @@ from torch import Tensor
 from gsplat.cuda._torch_impl import _quat_scale_to_matrix
 
 
+@functools.lru_cache(maxsize=None)
+def _aabb_signs(device: torch.device, dtype: torch.dtype) -> Tensor:
+    """Signs (1, 1, -1) of the homogeneous AABB test, cached per device and dtype."""
+    # Never cache an inference tensor, even if first called under inference mode.
+    with torch.inference_mode(False):
+        signs = torch.tensor([1.0, 1.0, -1.0], dtype=dtype)
+        return signs.reshape(1, 1, 3).to(device)
+
+
 def _fully_fused_projection_2dgs(
     means: Tensor,  # [N, 3]
     quats: Tensor,  # [N, 4]
@@ -47,7 +57,7 @@ def _fully_fused_projection_2dgs(
     M = torch.transpose(T_sl, -1, -2)  # [C, N, 3, 3]
 
     # compute the AABB of gaussian
-    test = torch.tensor([1.0, 1.0, -1.0], device=means.device).reshape(1, 1, 3)
+    test = _aabb_signs(means.device, means.dtype)  # [1, 1, 3]
     d = (M[..., 2] * M[..., 2] * test).sum(dim=-1, keepdim=True)  # [C, N, 1]
     valid = torch.abs(d) > eps
     f = torch.where(valid, test / d, torch.zeros_like(test)).unsqueeze(
@@ -62,15 +72,13 @@ def _fully_fused_projection_2dgs(
     radius = torch.ceil(3.0 * torch.max(extents, dim=-1).values)  # (C, N)
 
     valid = valid.squeeze(-1) & (depths > near_plane) & (depths < far_plane)
-    radius[~valid] = 0.0
-
     inside = (
         (means2d[..., 0] + radius > 0)
         & (means2d[..., 0] - radius < width)
         & (means2d[..., 1] + radius > 0)
         & (means2d[..., 1] - radius < height)
     )
-    radius[~inside] = 0.0
+    radius = radius.masked_fill(~(valid & inside), 0.0)
     radii = radius.int()
     return radii, means2d, depths, M, normals
 
@@ -218,9 +226,9 @@ def _rasterize_to_pixels_2dgs(
 
     # Split Gaussians into batches and iteratively accumulate the renderings
     block_size = tile_size * tile_size
-    isect_offsets_fl = torch.cat(
-        [isect_offsets.flatten(), torch.tensor([n_isects], device=device)]
-    )
+    isect_offsets_fl = isect_offsets.new_empty(isect_offsets.numel() + 1)
+    isect_offsets_fl[:-1] = isect_offsets.flatten()
+    isect_offsets_fl[-1] = n_isects  # scalar fill, no host-to-device tensor copy
     max_range = (isect_offsets_fl[1:] - isect_offsets_fl[:-1]).max().item()
     num_batches = (max_range + block_size - 1) // block_size
     for step in range(0, num_batches, batch_per_iter):
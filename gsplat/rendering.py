@@ -624,7 +624,7 @@ def _torch_rasterization(
         `packed`, `sparse_grad` and `absgrad`.
     """
     from gsplat._torch_impl_out import (
-        _fully_fused_projection,
+        _fully_fused_projection_compiled,
         _quat_scale_to_covar_preci,
         _rasterize_to_pixels,
     )
@@ -657,7 +657,7 @@ def _torch_rasterization(
     # Project Gaussians to 2D.
     # The results are with shape [C, N, ...]. Only the elements with radii > 0 are valid.
     covars, _ = _quat_scale_to_covar_preci(quats, scales, True, False, triu=False)
-    radii, means2d, depths, conics, compensations = _fully_fused_projection(
+    radii, means2d, depths, conics, compensations = _fully_fused_projection_compiled()(
         means,
         covars,
         viewmats,
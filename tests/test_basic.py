@@ -275,6 +275,80 @@ def test_projection(
     torch.testing.assert_close(v_means, _v_means, rtol=1e-2, atol=6e-2)
 
 
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="No CUDA device")
+def test_projection_triu(test_data):
+    from gsplat.cuda._torch_impl import (
+        _fully_fused_projection,
+        _quat_scale_to_covar_preci,
+    )
+
+    Ks = test_data["Ks"]
+    viewmats = test_data["viewmats"]
+    height = test_data["height"]
+    width = test_data["width"]
+    means = test_data["means"]
+
+    covars, _ = _quat_scale_to_covar_preci(
+        test_data["quats"], test_data["scales"], triu=False
+    )  # [N, 3, 3]
+    covars_triu, _ = _quat_scale_to_covar_preci(
+        test_data["quats"], test_data["scales"], triu=True
+    )  # [N, 6]
+
+    outputs = _fully_fused_projection(means, covars, viewmats, Ks, width, height)
+    _outputs = _fully_fused_projection(means, covars_triu, viewmats, Ks, width, height)
+    for output, _output in zip(outputs[:4], _outputs[:4]):
+        torch.testing.assert_close(output, _output)
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="No CUDA device")
+@pytest.mark.parametrize("camera_model", ["pinhole", "ortho", "fisheye"])
+def test_projection_bf16(
+    test_data, camera_model: Literal["pinhole", "ortho", "fisheye"]
+):
+    from gsplat.cuda._torch_impl import (
+        _fully_fused_projection,
+        _quat_scale_to_covar_preci,
+    )
+
+    Ks = test_data["Ks"]
+    viewmats = test_data["viewmats"]
+    height = test_data["height"]
+    width = test_data["width"]
+    means = test_data["means"]
+
+    covars, _ = _quat_scale_to_covar_preci(
+        test_data["quats"], test_data["scales"], triu=False
+    )  # [N, 3, 3]
+
+    radii, means2d, depths, conics, _ = _fully_fused_projection(
+        means, covars, viewmats, Ks, width, height, camera_model=camera_model
+    )
+    _radii, _means2d, _depths, _conics, _ = _fully_fused_projection(
+        means,
+        covars,
+        viewmats,
+        Ks,
+        width,
+        height,
+        camera_model=camera_model,
+        proj_dtype=torch.bfloat16,
+    )
+
+    # Only the covariance projection runs in bfloat16.
+    assert _means2d.dtype == means.dtype
+    assert _depths.dtype == means.dtype
+    assert _conics.dtype == means.dtype
+    torch.testing.assert_close(means2d, _means2d)
+    torch.testing.assert_close(depths, _depths)
+
+    valid = (radii > 0) & (_radii > 0)
+    torch.testing.assert_close(
+        radii[valid].float(), _radii[valid].float(), rtol=2e-2, atol=1
+    )
+    torch.testing.assert_close(conics[valid], _conics[valid], rtol=5e-2, atol=1e-2)
+
+
 @pytest.mark.skipif(not torch.cuda.is_available(), reason="No CUDA device")
 @pytest.mark.parametrize("fused", [False, True])
 @pytest.mark.parametrize("sparse_grad", [False, True])
@@ -572,6 +646,77 @@ def test_rasterize_to_pixels(test_data, channels: int):
     torch.testing.assert_close(v_backgrounds, _v_backgrounds, rtol=1e-3, atol=1e-3)
 
 
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="No CUDA device")
+def test_rasterize_to_pixels_bf16(test_data):
+    from gsplat.cuda._torch_impl import _accumulate_alphas, _rasterize_to_pixels
+    from gsplat.cuda._wrapper import (
+        fully_fused_projection,
+        isect_offset_encode,
+        isect_tiles,
+        quat_scale_to_covar_preci,
+    )
+
+    torch.manual_seed(42)
+
+    Ks = test_data["Ks"]
+    viewmats = test_data["viewmats"]
+    height = test_data["height"]
+    width = test_data["width"]
+    quats = test_data["quats"]
+    scales = test_data["scales"] * 0.1
+    means = test_data["means"]
+    opacities = test_data["opacities"]
+    C = len(Ks)
+    colors = torch.rand(C, len(means), 3, device=device)
+
+    covars, _ = quat_scale_to_covar_preci(quats, scales, compute_preci=False, triu=True)
+    radii, means2d, depths, conics, _ = fully_fused_projection(
+        means, covars, None, None, viewmats, Ks, width, height
+    )
+    opacities = opacities.repeat(C, 1)
+
+    tile_size = 16
+    tile_width = math.ceil(width / float(tile_size))
+    tile_height = math.ceil(height / float(tile_size))
+    _, isect_ids, flatten_ids = isect_tiles(
+        means2d, radii, depths, tile_size, tile_width, tile_height
+    )
+    isect_offsets = isect_offset_encode(isect_ids, C, tile_width, tile_height)
+
+    args = (
+        means2d,
+        conics,
+        colors,
+        opacities,
+        width,
+        height,
+        tile_size,
+        isect_offsets,
+        flatten_ids,
+    )
+    render_colors, render_alphas = _rasterize_to_pixels(*args)
+    _render_colors, _render_alphas = _rasterize_to_pixels(
+        *args, alpha_dtype=torch.bfloat16
+    )
+    assert _render_colors.dtype == render_colors.dtype
+    assert _render_alphas.dtype == render_alphas.dtype
+    torch.testing.assert_close(render_colors, _render_colors, rtol=5e-2, atol=5e-2)
+    torch.testing.assert_close(render_alphas, _render_alphas, rtol=5e-2, atol=5e-2)
+
+    # 0.999 rounds up to 1.0 in bfloat16, so the clamp must not happen there.
+    M = 1000
+    pixel_coords = torch.rand(M, 2, device=device)
+    alphas = _accumulate_alphas(
+        pixel_coords,
+        pixel_coords,
+        torch.rand(M, 3, device=device),
+        torch.ones(M, device=device),
+        alpha_dtype=torch.bfloat16,
+    )
+    assert alphas.dtype == pixel_coords.dtype
+    assert (alphas <= 0.999).all()
+
+
 @pytest.mark.skipif(not torch.cuda.is_available(), reason="No CUDA device")
 @pytest.mark.parametrize("sh_degree", [0, 1, 2, 3, 4])
 def test_sh(test_data, sh_degree: int):